@@ -6,27 +6,115 @@ Analyzes frontend project dependencies and generates structured reports.
 
 import os
 import re
+import sys
 import json
 from pathlib import Path
-from typing import Dict, List, Set, Optional, Union, DefaultDict, Tuple, Any
+from typing import Dict, List, Set, Optional, Union, DefaultDict, Tuple, Any, Iterator
 from dataclasses import dataclass, field
 from rich.console import Console
 from rich.tree import Tree
 from collections import defaultdict
-import fnmatch
+from itertools import repeat
 from functools import lru_cache
 import hashlib
 from datetime import datetime
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 
-@dataclass
+# @/ 别名导入第一段路径 -> DependencyInfo 中的分类字段（components 单独处理）
+_ALIAS_CATEGORIES = {'hooks': 'hooks', 'utils': 'utils', 'types': 'types', 'api': 'api'}
+_STYLE_SUFFIXES = ('.css', '.scss', '.less', '.sass')
+
+# 解析依赖路径时依次尝试的扩展名和目录索引文件
+_RESOLVE_EXTENSIONS = ('.tsx', '.jsx', '.ts', '.js', '.vue', '/index.tsx', '/index.jsx', '/index.ts', '/index.js', '/index.vue')
+
+# 默认的索引扩展名配置（只读，所有未自定义 index_extensions 的 Config 共享同一份）
+_DEFAULT_INDEX_EXTENSIONS = {
+    "vue": {
+        "extensions": [".vue"],
+        "patterns": [
+            r'import\s+(?:{[^}]*}|\*\s+as\s+\w+|\w+)\s+from\s+[\'"]([^\'"]+)[\'"]',
+            r'require\([\'"]([^\'"]+)[\'"]\)',
+            r'import\([\'"]([^\'"]+)[\'"]\)',
+            r'import\s+type\s+{[^}]*}\s+from\s+[\'"]([^\'"]+)[\'"]'
+        ]
+    },
+    "typescript": {
+        "extensions": [".ts", ".tsx"],
+        "patterns": [
+            r'import\s+(?:{[^}]*}|\*\s+as\s+\w+|\w+)\s+from\s+[\'"]([^\'"]+)[\'"]',
+            r'import\s+type\s+{[^}]*}\s+from\s+[\'"]([^\'"]+)[\'"]'
+        ]
+    },
+    "javascript": {
+        "extensions": [".js", ".jsx"],
+        "patterns": [
+            r'import\s+(?:{[^}]*}|\*\s+as\s+\w+|\w+)\s+from\s+[\'"]([^\'"]+)[\'"]',
+            r'require\([\'"]([^\'"]+)[\'"]\)'
+        ]
+    }
+}
+
+# 写入 Merkle 树的依赖分类及其节点类型，顺序即报告中的顺序（组件依赖单独处理，排在最前）
+_MERKLE_CATEGORIES = (('api', 'api'), ('hooks', 'hook'), ('utils', 'util'), ('external', 'external'))
+
+# 文件信息提取用到的模式在模块加载时编译一次；导入与导出各自以字面量开头，
+# 分开扫描可以利用正则引擎的前缀快速跳过，且两者的匹配可能互相重叠，不宜合并
+_FILE_IMPORT_RE = re.compile(r'import\s+.*?[\'"]([^\'"]+)[\'"]')
+_FILE_EXPORT_RE = re.compile(r'export\s+(?:default\s+)?(?:class|function|const|let|var)\s+(\w+)')
+
+# 功能特征检测合并成一个模式；特征关键字可能出现在导入语句内部（如 import axios），
+# 因此单独扫描，所有特征都命中后即可提前结束
+_FEATURE_RE = re.compile(
+    r'(?P<state_management>useState|useReducer|createStore|Vuex|Pinia)'
+    r'|(?P<routing>useRouter|useRoute|Router|createRouter)'
+    r'|(?P<api_calls>fetch|axios|useQuery|useMutation)'
+    r'|(?P<form_handling>useForm|v-model|formData|handleSubmit)'
+)
+
+# 可读格式中各功能特性对应的展示标签
+_FEATURE_ICONS = {
+    'state_management': '🔄 状态管理',
+    'routing': '🛣️ 路由处理',
+    'api_calls': '🌐 API调用',
+    'form_handling': '📝 表单处理'
+}
+
+# 全局共享的控制台实例
+console = Console()
+
+# Python 3.10+ 的 dataclass 支持 slots，去掉每个实例的 __dict__；旧版本保持普通 dataclass
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# 索引项：只有一个路径时直接存字符串（最常见的情况），多个路径时存列表
+IndexEntry = Union[str, List[str]]
+
+def _index_add(index: Dict[str, IndexEntry], key: str, path: str):
+    """向索引中添加路径（调用方保证同一个路径只添加一次）"""
+    current = index.get(key)
+    if current is None:
+        index[key] = path
+    elif isinstance(current, str):
+        index[key] = [current, path]
+    else:
+        current.append(path)
+
+def _index_paths(entry: Optional[IndexEntry]) -> Tuple[str, ...]:
+    """把索引项统一展开为路径元组"""
+    if entry is None:
+        return ()
+    return (entry,) if isinstance(entry, str) else tuple(entry)
+
+@dataclass(**_DATACLASS_SLOTS)
 class SearchIndex:
     """File search index"""
-    file_index: Dict[str, Set[str]] = field(default_factory=lambda: defaultdict(set))  # 文件名 -> 路径集合
-    import_index: Dict[str, Set[str]] = field(default_factory=lambda: defaultdict(set))  # 导入名 -> 文件路径集合
+    file_index: Dict[str, IndexEntry] = field(default_factory=dict)  # 文件名 -> 路径
+    import_index: Dict[str, IndexEntry] = field(default_factory=dict)  # 导入名 -> 文件路径
     extension_index: Dict[str, Set[str]] = field(default_factory=lambda: defaultdict(set))  # 扩展名 -> 文件路径集合
+    lower_index: Dict[str, Set[str]] = field(default_factory=lambda: defaultdict(set))  # 小写文件名 -> 原文件名集合
+    trigram_index: Dict[str, Set[str]] = field(default_factory=lambda: defaultdict(set))  # 三字符片段 -> 包含它的小写文件名集合
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Config:
     """Configuration for the analyzer"""
     project_path: Path
@@ -34,60 +122,7 @@ class Config:
     ignore_patterns: Set[str]
     analyze_mode: str = "deep"  # 'deep' or 'shallow'
     max_depth: int = 5
-    index_extensions: Dict[str, Dict[str, Union[List[str], List[str]]]] = field(default_factory=lambda: {
-        "vue": {
-            "extensions": [".vue"],
-            "patterns": [
-                r'import\s+(?:{[^}]*}|\*\s+as\s+\w+|\w+)\s+from\s+[\'"]([^\'"]+)[\'"]',
-                r'require\([\'"]([^\'"]+)[\'"]\)',
-                r'import\([\'"]([^\'"]+)[\'"]\)',
-                r'import\s+type\s+{[^}]*}\s+from\s+[\'"]([^\'"]+)[\'"]'
-            ]
-        },
-        "typescript": {
-            "extensions": [".ts", ".tsx"],
-            "patterns": [
-                r'import\s+(?:{[^}]*}|\*\s+as\s+\w+|\w+)\s+from\s+[\'"]([^\'"]+)[\'"]',
-                r'import\s+type\s+{[^}]*}\s+from\s+[\'"]([^\'"]+)[\'"]'
-            ]
-        },
-        "javascript": {
-            "extensions": [".js", ".jsx"],
-            "patterns": [
-                r'import\s+(?:{[^}]*}|\*\s+as\s+\w+|\w+)\s+from\s+[\'"]([^\'"]+)[\'"]',
-                r'require\([\'"]([^\'"]+)[\'"]\)'
-            ]
-        }
-    })
-
-    @staticmethod
-    def default_index_extensions():
-        """Default index extensions configuration"""
-        return {
-            "vue": {
-                "extensions": [".vue"],
-                "patterns": [
-                    r'import\s+(?:{[^}]*}|\*\s+as\s+\w+|\w+)\s+from\s+[\'"]([^\'"]+)[\'"]',
-                    r'require\([\'"]([^\'"]+)[\'"]\)',
-                    r'import\([\'"]([^\'"]+)[\'"]\)',
-                    r'import\s+type\s+{[^}]*}\s+from\s+[\'"]([^\'"]+)[\'"]'
-                ]
-            },
-            "typescript": {
-                "extensions": [".ts", ".tsx"],
-                "patterns": [
-                    r'import\s+(?:{[^}]*}|\*\s+as\s+\w+|\w+)\s+from\s+[\'"]([^\'"]+)[\'"]',
-                    r'import\s+type\s+{[^}]*}\s+from\s+[\'"]([^\'"]+)[\'"]'
-                ]
-            },
-            "javascript": {
-                "extensions": [".js", ".jsx"],
-                "patterns": [
-                    r'import\s+(?:{[^}]*}|\*\s+as\s+\w+|\w+)\s+from\s+[\'"]([^\'"]+)[\'"]',
-                    r'require\([\'"]([^\'"]+)[\'"]\)'
-                ]
-            }
-        }
+    index_extensions: Dict[str, Dict[str, Union[List[str], List[str]]]] = field(default_factory=lambda: _DEFAULT_INDEX_EXTENSIONS)
 
     @classmethod
     def load(cls, config_path: Union[str, Path] = "config.json") -> 'Config':
@@ -101,10 +136,9 @@ class Config:
                     ignore_patterns=set(data.get('ignore_patterns', [])),
                     analyze_mode=data.get('analyze_mode', 'deep'),
                     max_depth=data.get('max_depth', 5),
-                    index_extensions=data.get('index_extensions', cls.default_index_extensions())
+                    index_extensions=data.get('index_extensions', _DEFAULT_INDEX_EXTENSIONS)
                 )
         except FileNotFoundError:
-            console = Console()
             console.print(f"[yellow]Warning: Config file {config_path} not found. Using default configuration.[/yellow]")
             return cls(
                 project_path=Path.cwd(),
@@ -114,20 +148,40 @@ class Config:
                 max_depth=5
             )
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class DependencyInfo:
     """Stores dependency information for a file"""
     components: Dict[str, 'DependencyInfo'] = field(default_factory=dict)  # Changed from Set to Dict for nested deps
-    hooks: Set[str] = field(default_factory=set)
-    utils: Set[str] = field(default_factory=set)
-    types: Set[str] = field(default_factory=set)
-    styles: Set[str] = field(default_factory=set)
-    external: Set[str] = field(default_factory=set)
-    api: Set[str] = field(default_factory=set)
+    buckets: DefaultDict[str, Set[str]] = field(default_factory=lambda: defaultdict(set))  # 分类 -> 依赖集合（hooks, utils, types, styles, external, api）
     depth: int = 0
     parent: Optional[str] = None
 
-@dataclass
+    # 兼容原来按字段访问各分类的写法
+    @property
+    def hooks(self) -> Set[str]:
+        return self.buckets['hooks']
+
+    @property
+    def utils(self) -> Set[str]:
+        return self.buckets['utils']
+
+    @property
+    def types(self) -> Set[str]:
+        return self.buckets['types']
+
+    @property
+    def styles(self) -> Set[str]:
+        return self.buckets['styles']
+
+    @property
+    def external(self) -> Set[str]:
+        return self.buckets['external']
+
+    @property
+    def api(self) -> Set[str]:
+        return self.buckets['api']
+
+@dataclass(**_DATACLASS_SLOTS)
 class FileInfo:
     """Stores file information and its dependencies"""
     path: Path
@@ -135,7 +189,7 @@ class FileInfo:
     dependencies: DependencyInfo = field(default_factory=DependencyInfo)
     analyzed: bool = False
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class MerkleNode:
     """Merkle树节点"""
     hash: str
@@ -146,17 +200,34 @@ class MerkleNode:
     metadata: Dict[str, Any] = field(default_factory=dict)  # 存储额外的元数据
     imports: List[str] = field(default_factory=list)  # 存储导入语句
     exports: List[str] = field(default_factory=list)  # 存储导出内容
-    dependencies_count: Dict[str, int] = field(default_factory=lambda: defaultdict(int))  # 各类型依赖数量统计
+    dependencies_count: Dict[str, int] = field(default_factory=dict)  # 各类型依赖数量统计（键在构建时一次性写入）
+
+@lru_cache(maxsize=8192)
+def _short_hash(content: str) -> str:
+    """计算短哈希（相同的 "类型:内容" 在多个文件间经常重复，结果按内容缓存）"""
+    # 只用作可读的节点标识，不需要密码学强度；blake2b 直接输出 4 字节（8 位十六进制）的短哈希
+    return hashlib.blake2b(content.encode(), digest_size=4).hexdigest()
+
+def _local_path(name: str) -> Optional[Path]:
+    """依赖名看起来像文件路径时才构造 Path；不含路径分隔符的是包名，不会是本地文件"""
+    return Path(name) if '/' in name else None
+
+def _format_imports(imports: List[str]) -> str:
+    """导入列表的展示文本：最多列出前 3 个"""
+    return f"{', '.join(imports[:3])}{'...' if len(imports) > 3 else ''}"
 
 class DependencyMerkleTree:
     """依赖关系的Merkle树实现"""
     
     def __init__(self):
-        self.nodes: Dict[str, MerkleNode] = {}
+        # (名称, 类型) -> 节点；同名但类型不同的依赖（如文件本身与同路径的组件）各自独立
+        self.nodes: Dict[Tuple[str, str], MerkleNode] = {}
+        # 文件路径 -> 提取结果；读取失败（包括文件不存在）时为空字典，避免重复读取
+        self._file_info_cache: Dict[str, Dict[str, Any]] = {}
     
     def _calculate_hash(self, content: str) -> str:
         """计算内容的哈希值"""
-        return hashlib.sha256(content.encode()).hexdigest()[:8]  # 使用短哈希以提高可读性
+        return _short_hash(content)
     
     def _extract_file_info(self, file_path: Path) -> Dict[str, Any]:
         """提取文件的详细信息"""
@@ -164,39 +235,52 @@ class DependencyMerkleTree:
             content = file_path.read_text(encoding='utf-8')
             
             # 提取导入语句
-            imports = re.findall(r'import\s+.*?[\'"]([^\'"]+)[\'"]', content)
+            imports = _FILE_IMPORT_RE.findall(content)
             
             # 提取导出语句
-            exports = re.findall(r'export\s+(?:default\s+)?(?:class|function|const|let|var)\s+(\w+)', content)
+            exports = _FILE_EXPORT_RE.findall(content)
             
             # 统计代码行数（排除空行和注释）
-            lines = content.split('\n')
-            code_lines = len([line for line in lines if line.strip() and not line.strip().startswith('//')])
+            stripped = (line.strip() for line in content.split('\n'))
+            code_lines = sum(1 for line in stripped if line and not line.startswith('//'))
             
             # 检查是否包含特定功能
-            has_state_management = bool(re.search(r'useState|useReducer|createStore|Vuex|Pinia', content))
-            has_routing = bool(re.search(r'useRouter|useRoute|Router|createRouter', content))
-            has_api_calls = bool(re.search(r'fetch|axios|useQuery|useMutation', content))
-            has_form_handling = bool(re.search(r'useForm|v-model|formData|handleSubmit', content))
+            features = dict.fromkeys(_FEATURE_RE.groupindex, False)
+            remaining = len(features)
+            for match in _FEATURE_RE.finditer(content):
+                if not features[match.lastgroup]:
+                    features[match.lastgroup] = True
+                    remaining -= 1
+                    if not remaining:
+                        break
             
             return {
                 'imports': imports,
                 'exports': exports,
                 'code_lines': code_lines,
-                'features': {
-                    'state_management': has_state_management,
-                    'routing': has_routing,
-                    'api_calls': has_api_calls,
-                    'form_handling': has_form_handling
-                }
+                'features': features
             }
         except Exception:
             return {}
     
+    def _cached_file_info(self, file_path: Path) -> Dict[str, Any]:
+        """获取文件信息，同一路径只提取一次"""
+        key = str(file_path)
+        try:
+            return self._file_info_cache[key]
+        except KeyError:
+            pass
+        # 不再先用 exists() 探测：文件不存在时读取失败返回空字典，效果相同，少一次 stat
+        file_info = self._extract_file_info(file_path)
+        self._file_info_cache[key] = file_info
+        return file_info
+    
     def _create_node(self, name: str, type: str, content: Optional[str] = None, file_path: Optional[Path] = None) -> MerkleNode:
         """创建或获取节点"""
-        if name in self.nodes:
-            return self.nodes[name]
+        key = (name, type)
+        node = self.nodes.get(key)
+        if node is not None:
+            return node
             
         node_content = content or name
         node_hash = self._calculate_hash(f"{type}:{node_content}")
@@ -209,18 +293,20 @@ class DependencyMerkleTree:
             content=content,
             metadata={},
             imports=[],
-            exports=[],
-            dependencies_count=defaultdict(int)
+            exports=[]
         )
         
         # 如果提供了文件路径，提取更多信息
-        if file_path and file_path.exists():
-            file_info = self._extract_file_info(file_path)
+        file_info = self._cached_file_info(file_path) if file_path else None
+        if file_info:
             node.metadata.update(file_info)
             node.imports.extend(file_info.get('imports', []))
             node.exports.extend(file_info.get('exports', []))
+            if node.imports:
+                # 报告中导入列表的展示文本在建节点时算好，渲染时直接使用
+                node.metadata['imports_display'] = _format_imports(node.imports)
         
-        self.nodes[name] = node
+        self.nodes[key] = node
         return node
     
     def build_from_dependencies(self, deps: DependencyInfo, file_path: str) -> MerkleNode:
@@ -228,86 +314,71 @@ class DependencyMerkleTree:
         root = self._create_node(file_path, 'file', file_path=Path(file_path))
         
         # 统计依赖数量
-        root.dependencies_count.update({
-            'components': len(deps.components),
-            'api': len(deps.api),
-            'hooks': len(deps.hooks),
-            'utils': len(deps.utils),
-            'external': len(deps.external)
-        })
+        root.dependencies_count['components'] = len(deps.components)
+        for category, _ in _MERKLE_CATEGORIES:
+            root.dependencies_count[category] = len(deps.buckets.get(category, ()))
         
         # 添加组件依赖
-        for comp_name in deps.components:
-            comp_node = self._create_node(comp_name, 'component', file_path=Path(comp_name))
-            root.children.append(comp_node)
-        
-        # 添加API依赖
-        for api_name in deps.api:
-            api_node = self._create_node(api_name, 'api', file_path=Path(api_name))
-            root.children.append(api_node)
-        
-        # 添加Hooks依赖
-        for hook_name in deps.hooks:
-            hook_node = self._create_node(hook_name, 'hook', file_path=Path(hook_name))
-            root.children.append(hook_node)
-        
-        # 添加工具依赖
-        for util_name in deps.utils:
-            util_node = self._create_node(util_name, 'util', file_path=Path(util_name))
-            root.children.append(util_node)
-        
-        # 添加外部依赖
-        for ext_name in deps.external:
-            ext_node = self._create_node(ext_name, 'external')
-            root.children.append(ext_node)
+        children = root.children
+        children.extend(
+            self._create_node(comp_name, 'component', file_path=_local_path(comp_name))
+            for comp_name in deps.components
+        )
+        
+        # 按顺序添加 API、Hooks、工具和外部依赖（外部依赖不是本地文件）
+        for category, node_type in _MERKLE_CATEGORIES:
+            dep_names = deps.buckets.get(category)
+            if not dep_names:
+                continue
+            if category == 'external':
+                children.extend(self._create_node(dep_name, node_type) for dep_name in dep_names)
+            else:
+                children.extend(
+                    self._create_node(dep_name, node_type, file_path=_local_path(dep_name))
+                    for dep_name in dep_names
+                )
         
         return root
     
     def generate_ai_readable_format(self, root: MerkleNode, indent: int = 0) -> str:
         """生成AI友好的可读格式"""
         result = []
-        prefix = "  " * indent
-        
-        # 添加节点基本信息
-        node_info = f"{prefix}[{root.type}:{root.hash}] {root.name}"
-        result.append(node_info)
-        
-        # 添加元数据信息
-        if root.metadata:
-            meta_prefix = "  " * (indent + 1)
-            if 'code_lines' in root.metadata:
-                result.append(f"{meta_prefix}📊 代码行数: {root.metadata['code_lines']}")
+        # 显式栈代替递归，所有行追加到同一个列表，最后只拼接一次
+        stack = [(root, indent)]
+        while stack:
+            node, level = stack.pop()
+            prefix = "  " * level
+            sub_prefix = prefix + "  "
             
-            if 'features' in root.metadata:
-                features = root.metadata['features']
-                feature_icons = {
-                    'state_management': '🔄 状态管理',
-                    'routing': '🛣️ 路由处理',
-                    'api_calls': '🌐 API调用',
-                    'form_handling': '📝 表单处理'
-                }
-                active_features = [f"{icon}" for key, icon in feature_icons.items() if features.get(key)]
-                if active_features:
-                    result.append(f"{meta_prefix}✨ 功能特性: {' '.join(active_features)}")
-        
-        # 添加依赖统计
-        if root.dependencies_count:
-            stats_prefix = "  " * (indent + 1)
-            stats = [f"{k}: {v}" for k, v in root.dependencies_count.items() if v > 0]
-            if stats:
-                result.append(f"{stats_prefix}📈 依赖统计: {', '.join(stats)}")
-        
-        # 添加导入导出信息
-        if root.imports:
-            imports_prefix = "  " * (indent + 1)
-            result.append(f"{imports_prefix}📥 导入: {', '.join(root.imports[:3])}{'...' if len(root.imports) > 3 else ''}")
-        if root.exports:
-            exports_prefix = "  " * (indent + 1)
-            result.append(f"{exports_prefix}📤 导出: {', '.join(root.exports)}")
-        
-        # 递归处理子节点
-        for child in root.children:
-            result.append(self.generate_ai_readable_format(child, indent + 1))
+            # 添加节点基本信息
+            result.append(f"{prefix}[{node.type}:{node.hash}] {node.name}")
+            
+            # 添加元数据信息
+            if node.metadata:
+                if 'code_lines' in node.metadata:
+                    result.append(f"{sub_prefix}📊 代码行数: {node.metadata['code_lines']}")
+                
+                if 'features' in node.metadata:
+                    features = node.metadata['features']
+                    active_features = [icon for key, icon in _FEATURE_ICONS.items() if features.get(key)]
+                    if active_features:
+                        result.append(f"{sub_prefix}✨ 功能特性: {' '.join(active_features)}")
+            
+            # 添加依赖统计
+            if node.dependencies_count:
+                stats = [f"{k}: {v}" for k, v in node.dependencies_count.items() if v > 0]
+                if stats:
+                    result.append(f"{sub_prefix}📈 依赖统计: {', '.join(stats)}")
+            
+            # 添加导入导出信息
+            if node.imports:
+                imports_display = node.metadata.get('imports_display') or _format_imports(node.imports)
+                result.append(f"{sub_prefix}📥 导入: {imports_display}")
+            if node.exports:
+                result.append(f"{sub_prefix}📤 导出: {', '.join(node.exports)}")
+            
+            # 子节点逆序入栈，保证按原顺序输出
+            stack.extend((child, level + 1) for child in reversed(node.children))
         
         return "\n".join(result)
 
@@ -342,10 +413,31 @@ class FrontendAnalyzer:
         self.config = config
         self.files: Dict[str, FileInfo] = {}
         self.dependency_graph: DefaultDict[str, Set[str]] = defaultdict(set)
-        self.console = Console()
+        self.console = console
         self.search_index = SearchIndex()
+        self._ignore_patterns = frozenset(config.ignore_patterns)
+        
+        # 项目根目录和当前目录在整个分析过程中不变，只计算一次
+        self._project_root = config.project_path.parent.parent.parent
+        self._project_root_str = str(self._project_root)
+        # 根目录为相对路径 "." 时，其下的路径字符串不带 "./"，前缀记为空串
+        self._root_prefix = '' if self._project_root_str == '.' else os.path.join(self._project_root_str, '')
+        # 前缀比较用 normcase 后的形式，大小写不敏感的系统（Windows）上与 relative_to 一致
+        self._root_prefix_norm = os.path.normcase(self._root_prefix)
+        self._current_dir = config.project_path.parent
+        
+        # "@" 别名替换后的前缀，例如 "@": "src" -> "src/"
+        self._alias_prefix = f"{config.alias_mappings['@']}/" if '@' in config.alias_mappings else None
         self.merkle_tree = DependencyMerkleTree()
         
+        # 候选文件只依赖索引内容，按名字缓存；索引重建时需要 cache_clear()
+        self._candidates = lru_cache(maxsize=None)(self._find_candidates)
+        self._index_built = False
+        # 目录列表缓存（一次分析过程中文件系统视为不变），用于解析依赖时探测扩展名
+        self._dir_entries = lru_cache(maxsize=None)(self._list_dir)
+        # 导入路径 -> 解析结果（包括解析失败的 None）
+        self._resolved_paths: Dict[str, Optional[Path]] = {}
+        
         # 创建reports目录
         self.reports_dir = Path("reports")
         self.reports_dir.mkdir(exist_ok=True)
@@ -368,6 +460,45 @@ class FrontendAnalyzer:
                 'type': r'import\s+type\s+{[^}]*}\s+from\s+[\'"]([^\'"]+)[\'"]'
             }
 
+        # 扩展名 -> 文件类型，同一个扩展名出现在多个语言中时以配置中靠前的为准
+        self._ext_to_lang: Dict[str, str] = {}
+        for lang, lang_config in config.index_extensions.items():
+            for ext in lang_config['extensions']:
+                self._ext_to_lang.setdefault(ext, lang)
+
+        # 将所有导入模式合并为一个预编译的交替正则，每个文件只需扫描一遍；
+        # 保持 str 模式：bytes 模式下 \w、\s 只匹配 ASCII，会漏掉中文等非 ASCII 标识符的导入
+        self._import_patterns_list = list(dict.fromkeys(self.import_patterns.values()))
+        self._import_re, self._import_groups = self._compile_import_patterns(self._import_patterns_list)
+
+    @staticmethod
+    def _compile_import_patterns(patterns: List[str]) -> Tuple[Optional[re.Pattern], Dict[int, Tuple[int, int]]]:
+        """把导入模式合并成一个交替正则，返回 (合并后的正则, 外层分组号 -> (模式序号, 该模式第 1 个分组的分组号))
+
+        每个模式外面包一层捕获分组，命中时 lastindex 就是这层分组，据此取回该模式自己的 group(1)。
+        模式带全局内联标志、重名分组、数字反向引用或条件分组，或者没有捕获分组时无法安全合并，
+        返回 None，由调用方逐个模式扫描（与原来的行为一致）。
+        """
+        groups: Dict[int, Tuple[int, int]] = {}
+        offset = 1
+        for index, pattern in enumerate(patterns):
+            try:
+                pattern_groups = re.compile(pattern).groups
+            except re.error:
+                return None, {}
+            # 包一层分组后数字反向引用和条件分组引用的分组号会错位
+            if pattern_groups < 1 or re.search(r'\\[1-9]|\(\?\(', pattern):
+                return None, {}
+            groups[offset] = (index, offset + 1)
+            offset += pattern_groups + 1
+        
+        if not groups:
+            return None, {}
+        try:
+            return re.compile('|'.join(f'({pattern})' for pattern in patterns)), groups
+        except re.error:
+            return None, {}
+
     def _load_prompts(self) -> Dict:
         """加载提示词配置"""
         try:
@@ -390,7 +521,7 @@ class FrontendAnalyzer:
         try:
             target_file = Path(self.config.project_path)
             if target_file.is_file():
-                rel_path = target_file.relative_to(target_file.parent.parent.parent)
+                rel_path = target_file.relative_to(self._project_root)
                 
                 # 生成Merkle树
                 merkle_root = None
@@ -419,82 +550,84 @@ class FrontendAnalyzer:
 
     def _should_ignore(self, path: Path) -> bool:
         """检查是否应该忽略该文件"""
-        return any(part in self.config.ignore_patterns for part in path.parts)
+        return not self._ignore_patterns.isdisjoint(path.parts)
     
     def _determine_file_type(self, file_path: Path) -> Optional[str]:
         """根据文件路径和扩展名确定文件类型"""
-        suffix = file_path.suffix
-        
-        # 从配置中获取文件类型
-        for lang, lang_config in self.config.index_extensions.items():
-            if suffix in lang_config['extensions']:
-                return lang
-                
-        return None
+        return self._ext_to_lang.get(file_path.suffix)
     
     def _extract_dependencies(self, content: str, deps: DependencyInfo):
         """从文件内容中提取所有依赖"""
-        for pattern_name, pattern in self.import_patterns.items():
-            matches = re.finditer(pattern, content)
-            for match in matches:
-                import_path = match.group(1)
-                self._categorize_dependency(import_path, deps)
+        if self._import_re is None:
+            # 无法合并的模式逐个扫描；没有配置任何模式时不扫描
+            matches = [
+                match.group(1)
+                for pattern in self._import_patterns_list
+                for match in re.finditer(pattern, content)
+            ]
+        else:
+            # lastindex 是命中模式外层的分组，取该模式自己的 group(1)；
+            # 按模式顺序稳定排序，结果顺序与逐个模式扫描时一致
+            found = []
+            for match in self._import_re.finditer(content):
+                index, group = self._import_groups[match.lastindex]
+                found.append((index, match.group(group)))
+            found.sort(key=lambda item: item[0])
+            matches = [import_path for _, import_path in found]
+        
+        # 同一文件中重复的导入先去重（保持首次出现的顺序），每个只分类一次
+        for import_path in dict.fromkeys(matches):
+            self._categorize_dependency(import_path, deps)
     
     def _categorize_dependency(self, import_path: str, deps: DependencyInfo):
         """根据导入路径对依赖进行分类"""
-        # 处理以 @ 开头的别名导入
+        # 处理以 @ 开头的别名导入：按 @/ 后的第一段直接查表分类
         if import_path.startswith('@/'):
-            parts = import_path.split('/')
-            if len(parts) > 1:
-                category = parts[1]  # 获取 @/ 后的类别
-                if category == 'components':
-                    deps.components[import_path] = DependencyInfo(depth=deps.depth + 1, parent=import_path)
-                elif category == 'hooks':
-                    deps.hooks.add(import_path)
-                elif category == 'utils':
-                    deps.utils.add(import_path)
-                elif category == 'types':
-                    deps.types.add(import_path)
-                elif category == 'api':
-                    deps.api.add(import_path)
-                elif category.endswith(('.css', '.scss', '.less', '.sass')):
-                    deps.styles.add(import_path)
-                else:
-                    # 默认添加到工具类
-                    deps.utils.add(import_path)
+            category = import_path.split('/', 2)[1]  # 获取 @/ 后的类别
+            if category == 'components':
+                deps.components[import_path] = DependencyInfo(depth=deps.depth + 1, parent=import_path)
+                return
+            bucket = _ALIAS_CATEGORIES.get(category)
+            if bucket is None:
+                # 样式文件，其余默认添加到工具类
+                bucket = 'styles' if category.endswith(_STYLE_SUFFIXES) else 'utils'
+            deps.buckets[bucket].add(import_path)
             return
         
         # 处理相对路径和其他情况
         if 'components' in import_path:
             deps.components[import_path] = DependencyInfo(depth=deps.depth + 1, parent=import_path)
         elif 'hooks' in import_path:
-            deps.hooks.add(import_path)
+            deps.buckets['hooks'].add(import_path)
         elif 'utils' in import_path:
-            deps.utils.add(import_path)
+            deps.buckets['utils'].add(import_path)
         elif 'types' in import_path or import_path.endswith('.d.ts'):
-            deps.types.add(import_path)
+            deps.buckets['types'].add(import_path)
         elif 'api' in import_path:
-            deps.api.add(import_path)
-        elif import_path.endswith(('.css', '.scss', '.less', '.sass')):
-            deps.styles.add(import_path)
-        elif not any(import_path.startswith(p) for p in ['/', '.', '@']):
-            deps.external.add(import_path)
+            deps.buckets['api'].add(import_path)
+        elif import_path.endswith(_STYLE_SUFFIXES):
+            deps.buckets['styles'].add(import_path)
+        elif not import_path.startswith(('/', '.', '@')):
+            deps.buckets['external'].add(import_path)
         else:
             # 默认添加到工具类
-            deps.utils.add(import_path)
+            deps.buckets['utils'].add(import_path)
     
-    def _process_file(self, file_path: Path, depth: int = 0):
-        """处理单个文件并提取其依赖"""
+    def _scan_file(self, file_path: Path, depth: int = 0) -> Optional[Tuple[str, FileInfo]]:
+        """读取单个文件并提取其依赖，不修改共享状态，可以在线程池中执行"""
         try:
-            relative_path = file_path.relative_to(self.config.project_path.parent.parent.parent)
+            # 文件键与 _is_analyzed、依赖图使用同一个规则计算
+            file_key = self._relative_key(file_path)
+            if file_key is None:
+                raise ValueError(f"{file_path} 不在项目目录 {self._project_root} 内")
             if self._should_ignore(file_path):
-                return
+                return None
             
             file_type = self._determine_file_type(file_path)
             if not file_type:
-                return
+                return None
                 
-            file_info = FileInfo(path=relative_path, file_type=file_type)
+            file_info = FileInfo(path=Path(file_key), file_type=file_type)
             content = file_path.read_text(encoding='utf-8')
             
             deps = DependencyInfo(depth=depth)
@@ -502,10 +635,18 @@ class FrontendAnalyzer:
             file_info.dependencies = deps
             file_info.analyzed = True
             
-            self.files[str(relative_path)] = file_info
+            return sys.intern(file_key), file_info
             
         except Exception as e:
             self.console.print(f"[red]Error processing {file_path}: {e}[/red]")
+            return None
+    
+    def _process_file(self, file_path: Path, depth: int = 0):
+        """处理单个文件并提取其依赖"""
+        result = self._scan_file(file_path, depth)
+        if result:
+            file_key, file_info = result
+            self.files[file_key] = file_info
     
     def analyze_file(self, file_path: Union[str, Path], depth: int = 0):
         """分析特定文件及其依赖"""
@@ -513,6 +654,10 @@ class FrontendAnalyzer:
             return
         
         file_path = Path(file_path)
+        # 已经分析过的文件（及其依赖）不再重复读取和扫描
+        if self._is_analyzed(file_path):
+            return
+        
         if not file_path.exists():
             self.console.print(f"[red]抱歉，找不到文件: {file_path}[/red]")
             return
@@ -524,158 +669,247 @@ class FrontendAnalyzer:
             self._analyze_dependencies(file_path, depth + 1)
     
     def _analyze_dependencies(self, file_path: Path, depth: int):
-        """递归分析文件的依赖"""
-        try:
-            file_key = str(file_path.relative_to(self.config.project_path.parent.parent.parent))
-        except ValueError:
-            file_key = str(file_path)
-            
+        """按层遍历并分析文件的依赖（用工作队列代替递归）"""
+        seen: Set[Path] = {file_path}
+        frontier = [file_path]
+        with ThreadPoolExecutor() as executor:
+            while frontier:
+                # 解析当前层所有文件的依赖，收集下一层还没有访问过的文件
+                pending: List[Path] = []
+                for current_path in frontier:
+                    for resolved_path in self._resolve_file_dependencies(current_path):
+                        if resolved_path not in seen and not self._is_analyzed(resolved_path):
+                            seen.add(resolved_path)
+                            pending.append(resolved_path)
+                
+                if depth > self.config.max_depth or not pending:
+                    return
+                
+                # 同一层的依赖文件在线程池中并发读取和扫描，结果只在主线程合并
+                for result in executor.map(self._scan_file, pending, repeat(depth)):
+                    if result:
+                        dep_key, dep_info = result
+                        self.files[dep_key] = dep_info
+                
+                frontier = pending
+                depth += 1
+    
+    def _resolve_file_dependencies(self, file_path: Path) -> Iterator[Path]:
+        """解析文件的组件依赖和其他依赖（hooks, utils等），同时记录依赖关系图"""
+        file_key = sys.intern(self._relative_key(file_path) or str(file_path))
         if file_key not in self.files:
             return
         
-        file_info = self.files[file_key]
-        deps = file_info.dependencies
-        
-        # 分析组件依赖
-        for comp_path, comp_dep in deps.components.items():
-            resolved_path = self._resolve_dependency_path(comp_path)
-            if resolved_path:
-                self.dependency_graph[file_key].add(str(resolved_path))
-                if not self._is_analyzed(resolved_path):
-                    self.analyze_file(resolved_path, depth)
-        
-        # 分析其他依赖（hooks, utils等）
-        for dep_set in [deps.hooks, deps.utils]:
+        deps = self.files[file_key].dependencies
+        for dep_set in [deps.components, deps.buckets.get('hooks', ()), deps.buckets.get('utils', ())]:
             for dep_path in dep_set:
                 resolved_path = self._resolve_dependency_path(dep_path)
                 if resolved_path:
-                    self.dependency_graph[file_key].add(str(resolved_path))
-                    if not self._is_analyzed(resolved_path):
-                        self.analyze_file(resolved_path, depth)
+                    self.dependency_graph[file_key].add(sys.intern(str(resolved_path)))
+                    yield resolved_path
     
     def _is_analyzed(self, file_path: Path) -> bool:
         """检查文件是否已经被分析过"""
+        file_info = self.files.get(self._relative_key(file_path))
+        return file_info is not None and file_info.analyzed
+    
+    def _relative_key(self, file_path: Path) -> Optional[str]:
+        """返回相对项目根目录的路径字符串，不在项目内时返回 None（先做字符串前缀比较，不命中再用 relative_to 确认）"""
+        path_str = str(file_path)
+        if not self._root_prefix:
+            # 根目录是 "."：相对路径本身就是键，绝对路径不在项目内（与 relative_to(Path('.')) 一致）
+            return None if os.path.isabs(path_str) else path_str
+        if os.path.normcase(path_str).startswith(self._root_prefix_norm):
+            return path_str[len(self._root_prefix):]
+        # 前缀不同的写法（如大小写、盘符差异）交给 relative_to 判断，结果与原来的逻辑一致
         try:
-            relative_path = str(file_path.relative_to(self.config.project_path.parent.parent.parent))
-            return relative_path in self.files and self.files[relative_path].analyzed
+            return str(file_path.relative_to(self._project_root))
         except ValueError:
-            return False
+            return None
     
     def _resolve_dependency_path(self, import_path: str) -> Optional[Path]:
-        """解析依赖路径"""
-        project_root = self.config.project_path.parent.parent.parent
-        current_dir = self.config.project_path.parent
+        """解析依赖路径（解析只依赖导入路径本身，结果按导入路径缓存）"""
+        if import_path not in self._resolved_paths:
+            self._resolved_paths[import_path] = self._lookup_dependency_path(import_path)
+        return self._resolved_paths[import_path]
+    
+    def _lookup_dependency_path(self, import_path: str) -> Optional[Path]:
+        """在文件系统和索引中查找依赖路径"""
+        project_root = self._project_root
+        current_dir = self._current_dir
         
         # 1. 处理相对路径
         if import_path.startswith('./') or import_path.startswith('../'):
             resolved_path = (current_dir / import_path).resolve()
-            if resolved_path.exists():
+            if self._path_exists(resolved_path):
                 return resolved_path
             
             # 尝试添加不同的扩展名
-            for ext in ['.tsx', '.jsx', '.ts', '.js', '.vue', '/index.tsx', '/index.jsx', '/index.ts', '/index.js', '/index.vue']:
+            for ext in _RESOLVE_EXTENSIONS:
                 test_path = resolved_path.with_suffix(ext) if not ext.startswith('/') else Path(str(resolved_path) + ext)
-                if test_path.exists():
+                if self._path_exists(test_path):
                     return test_path
         
-        # 2. 处理别名路径
-        if import_path.startswith('@/'):
-            # 如果配置中有 "@": "src" 的映射
-            if "@" in self.config.alias_mappings:
-                # 直接将 @/ 替换为 src/
-                normalized_path = import_path.replace('@/', f"{self.config.alias_mappings['@']}/", 1)
-                full_path = project_root / normalized_path
-                
-                # 检查路径是否存在
-                if full_path.exists():
-                    return full_path
-                
-                # 尝试不同的扩展名
-                for ext in ['.tsx', '.jsx', '.ts', '.js', '.vue', '/index.tsx', '/index.jsx', '/index.ts', '/index.js', '/index.vue']:
-                    test_path = full_path.with_suffix(ext) if not ext.startswith('/') else Path(str(full_path) + ext)
-                    if test_path.exists():
-                        return test_path
+        # 2. 处理别名路径（如果配置中有 "@": "src" 的映射）
+        if self._alias_prefix is not None and import_path.startswith('@/'):
+            # 直接将 @/ 替换为 src/
+            full_path = project_root / (self._alias_prefix + import_path[2:])
+            
+            # 检查路径是否存在
+            if self._path_exists(full_path):
+                return full_path
+            
+            # 尝试不同的扩展名
+            for ext in _RESOLVE_EXTENSIONS:
+                test_path = full_path.with_suffix(ext) if not ext.startswith('/') else Path(str(full_path) + ext)
+                if self._path_exists(test_path):
+                    return test_path
         
         # 3. 检查导入索引
-        if import_path in self.search_index.import_index:
-            paths = self.search_index.import_index[import_path]
-            if paths:
-                return project_root / next(iter(paths))
-        
-        # 4. 智能查找
-        base_name = os.path.basename(import_path)
-        if base_name:
-            # 移除可能的扩展名
-            base_name = os.path.splitext(base_name)[0]
-            found_path = self._find_file(base_name, current_dir)
-            if found_path:
-                return found_path
+        paths = _index_paths(self.search_index.import_index.get(import_path))
+        if paths:
+            return project_root / paths[0]
         
-        # 5. 尝试不同的扩展名
+        # 4. 尝试不同的扩展名（按导入路径精确探测，优先于按文件名的模糊查找）
         base_path = project_root / import_path.lstrip('/')
-        for ext in ['.tsx', '.jsx', '.ts', '.js', '.vue', '/index.tsx', '/index.jsx', '/index.ts', '/index.js', '/index.vue']:
+        for ext in _RESOLVE_EXTENSIONS:
             full_path = base_path.with_suffix(ext) if not ext.startswith('/') else Path(str(base_path) + ext)
-            if full_path.exists():
+            if self._path_exists(full_path):
                 return full_path
             
             # 额外检查相对于当前目录的路径
             current_full_path = (current_dir / import_path).with_suffix(ext) if not ext.startswith('/') else Path(str(current_dir / import_path) + ext)
-            if current_full_path.exists():
+            if self._path_exists(current_full_path):
                 return current_full_path
         
+        # 5. 智能查找
+        base_name = os.path.basename(import_path)
+        if base_name:
+            # 移除可能的扩展名
+            base_name = os.path.splitext(base_name)[0]
+            found_path = self._find_file(base_name, current_dir)
+            if found_path:
+                return found_path
+        
         return None
     
+    def _list_dir(self, directory: str) -> frozenset:
+        """列出目录下所有条目的小写名字，目录不存在时返回空集合"""
+        try:
+            with os.scandir(directory) as entries:
+                return frozenset(entry.name.lower() for entry in entries)
+        except OSError:
+            return frozenset()
+    
+    def _path_exists(self, path: Path) -> bool:
+        """判断路径是否存在：先查缓存的目录列表，不在列表中的候选直接排除，省掉 stat 调用"""
+        name = path.name
+        if name in ('', '.', '..'):
+            return path.exists()
+        if name.lower() not in self._dir_entries(str(path.parent)):
+            return False
+        # 名字按小写比较，兼容大小写不敏感的文件系统，命中后再用 exists() 确认
+        return path.exists()
+    
+    def _build_search_index(self):
+        """遍历当前目录建立文件索引（os.scandir 复用目录项类型，忽略的目录直接剪枝不再进入）"""
+        # 索引范围限定在当前目录，与原来 rglob 的搜索范围一致；
+        # 项目根目录是当前目录往上两级，可能是 / 或用户主目录，不能整个遍历
+        start = str(self._current_dir)
+        # 遍历得到的路径都以遍历起点加分隔符开头（起点为 "." 时是 "./"），换成相对项目根目录的路径
+        prefix_len = len(os.path.join(start, ''))
+        start_key = self._relative_key(self._current_dir)
+        key_prefix = '' if start_key in (None, '', '.') else os.path.join(start_key, '')
+        stack = [start]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.name in self._ignore_patterns:
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            relative_path = sys.intern(key_prefix + entry.path[prefix_len:])
+                            stem, suffix = os.path.splitext(entry.name)
+                            stem = sys.intern(stem)
+                            if stem not in self.search_index.file_index:
+                                self._index_name(stem)
+                            _index_add(self.search_index.file_index, stem, relative_path)
+                            self.search_index.extension_index[suffix].add(relative_path)
+            except OSError:
+                continue
+        
+        self._index_built = True
+        self._candidates.cache_clear()
+    
+    def _index_name(self, stem: str):
+        """为文件名建立小写索引和三字符片段索引，供模糊匹配使用"""
+        lower_stem = stem.lower()
+        if lower_stem not in self.search_index.lower_index:
+            for i in range(len(lower_stem) - 2):
+                self.search_index.trigram_index[lower_stem[i:i + 3]].add(lower_stem)
+        self.search_index.lower_index[lower_stem].add(stem)
+    
+    def _find_candidates(self, name: str) -> Tuple[str, ...]:
+        """在索引中查找候选文件（只依赖索引本身，结果可以按名字缓存）"""
+        # 1. 检查索引中的精确匹配
+        paths = _index_paths(self.search_index.file_index.get(name))
+        if paths:
+            return tuple(sorted(paths))
+        
+        # 2. 尝试模糊匹配（忽略大小写的子串匹配，*name* 已覆盖前缀和后缀两种情况）
+        # 包含 name 的文件名一定包含 name 的前三个字符，先用片段索引缩小范围；更短的名字只能逐个比较
+        lower_name = name.lower()
+        if len(lower_name) >= 3:
+            lower_names = self.search_index.trigram_index.get(lower_name[:3], ())
+        else:
+            lower_names = self.search_index.lower_index
+        
+        matches = set()
+        for lower_filename in lower_names:
+            if lower_name in lower_filename:
+                for filename in self.search_index.lower_index[lower_filename]:
+                    matches.update(_index_paths(self.search_index.file_index[filename]))
+        # 按路径排序返回，多个候选与当前目录距离相同时结果不随字符串哈希顺序变化
+        return tuple(sorted(matches))
+    
     def _find_file(self, name: str, current_dir: Optional[Path] = None) -> Optional[Path]:
         """智能文件查找"""
-        project_root = self.config.project_path.parent.parent.parent
-        
-        # 1. 检查索引中的精确匹配
-        if name in self.search_index.file_index:
-            paths = self.search_index.file_index[name]
-            if len(paths) == 1:
-                return project_root / next(iter(paths))
-            elif current_dir:
-                # 如果有多个匹配，优先选择离当前目录最近的
-                return min(
-                    (project_root / path for path in paths),
-                    key=lambda p: len(set(p.parts) ^ set(current_dir.parts))
-                )
-        
-        # 2. 尝试模糊匹配
-        for pattern in [f"*{name}*", f"*{name}", f"{name}*"]:
-            matches = set()
-            for filename, paths in self.search_index.file_index.items():
-                if fnmatch.fnmatch(filename.lower(), pattern.lower()):
-                    matches.update(paths)
-            
-            if matches:
-                if len(matches) == 1:
-                    return project_root / next(iter(matches))
-                elif current_dir:
-                    return min(
-                        (project_root / path for path in matches),
-                        key=lambda p: len(set(p.parts) ^ set(current_dir.parts))
-                    )
-        
-        # 3. 在当前目录中搜索
-        if current_dir:
-            for file_path in current_dir.rglob(f"*{name}*"):
-                if file_path.is_file() and not self._should_ignore(file_path):
-                    return file_path
+        project_root = self._project_root
+        
+        # 索引在第一次查找时建立，之后的查找都不再访问文件系统
+        if not self._index_built:
+            self._build_search_index()
+        
+        # 1-2. 索引中的精确匹配和模糊匹配
+        matches = self._candidates(name)
+        if len(matches) == 1:
+            return project_root / matches[0]
+        elif matches and current_dir:
+            # 如果有多个匹配，优先选择离当前目录最近的（距离相同时取排序靠前的路径）
+            return min(
+                (project_root / path for path in matches),
+                key=lambda p: len(set(p.parts) ^ set(current_dir.parts))
+            )
         
         return None
 
 def display_menu(prompts: Dict) -> str:
     """显示交互式菜单"""
-    console = Console()
-    console.print("\n[bold magenta]✨ 欢迎使用前端小助手 ✨[/bold magenta]")
-    console.print("[bold magenta]让我们一起来分析代码吧~ [/bold magenta]\n")
+    lines = [
+        "\n[bold magenta]✨ 欢迎使用前端小助手 ✨[/bold magenta]",
+        "[bold magenta]让我们一起来分析代码吧~ [/bold magenta]\n"
+    ]
     
     # 显示所有选项
     for i, (type_key, type_info) in enumerate(prompts['commit_types'].items(), 1):
-        console.print(f"[green]{i}.[/green] {type_info['title']} [cyan]({type_key})[/cyan]")
+        lines.append(f"[green]{i}.[/green] {type_info['title']} [cyan]({type_key})[/cyan]")
     
-    console.print("\n[yellow]请选择分析类型哦~ (输入数字)[/yellow]")
+    lines.append("\n[yellow]请选择分析类型哦~ (输入数字)[/yellow]")
+    # 整个菜单一次性输出
+    console.print("\n".join(lines))
     
     while True:
         try:
@@ -689,18 +923,14 @@ def display_menu(prompts: Dict) -> str:
 
 def main():
     """Main entry point"""
-    console = Console()
-    
     try:
         config = Config.load()
         analyzer = FrontendAnalyzer(config)
         
-        # 加载提示词配置
-        try:
-            with open('prompts.json', 'r', encoding='utf-8') as f:
-                prompts = json.load(f)
-        except Exception as e:
-            console.print(f"[red]哎呀，加载提示词配置失败了: {e}[/red]")
+        # 复用分析器已加载的提示词配置，不再重复读取 prompts.json
+        prompts = analyzer.prompts
+        if not prompts.get('commit_types'):
+            console.print("[red]哎呀，加载提示词配置失败了: 没有可用的分析类型[/red]")
             return 1
         
         # 显示菜单并获取用户选择